@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, Query, Depends, Header, Body, Request
-from fastapi.responses import JSONResponse
-from typing import Optional
+from fastapi.responses import ORJSONResponse, Response
+from typing import List, Optional
 from datetime import datetime
 import secrets
+import msgspec
 import structlog
 from extensions import limiter, audit_logger
 
@@ -13,10 +14,15 @@ from models.review import (
     ReviewSummary,
     APIToken
 )
+from models.review_msgspec import ReviewListResponseStruct
 from services.supabase import supabase
+from config.settings import get_settings
 
 router = APIRouter()
 
+# Upper bound on reviews accepted by the bulk endpoint in one request
+MAX_BULK_REVIEWS = 500
+
 async def require_api_token(authorization: Optional[str] = Header(None)):
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing or invalid API token")
@@ -25,15 +31,21 @@ async def require_api_token(authorization: Optional[str] = Header(None)):
         raise HTTPException(status_code=401, detail="Invalid API token")
     return token
 
-@router.post("/tokens", response_model=APIToken)
-@limiter.limit("5/minute")
+def _is_unique_violation(e: Exception) -> bool:
+    """Check whether an error is a Postgres unique constraint violation (code 23505)"""
+    err = e.args[0] if getattr(e, 'args', None) else None
+    if isinstance(err, dict):
+        return err.get('code') == '23505'
+    return isinstance(err, str) and '23505' in err
+
+@router.post("/tokens", response_model=APIToken, dependencies=[Depends(limiter.limit("5/minute"))])
 async def create_api_token(request: Request, name: str = Body(..., embed=True)):
     try:
         token = secrets.token_urlsafe(32)
         created = await supabase.create_token(token, name)
         if not created:
             audit_logger.info("create_token_failed", name=name)
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "success": False,
@@ -45,7 +57,7 @@ async def create_api_token(request: Request, name: str = Body(..., embed=True)):
         return APIToken(token=created["token"], name=created.get("name"), created_at=created.get("created_at"))
     except Exception as e:
         audit_logger.error("create_token_error", name=name, error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -54,13 +66,12 @@ async def create_api_token(request: Request, name: str = Body(..., embed=True)):
             }
         )
 
-@router.post("/reviews", response_model=dict, dependencies=[Depends(require_api_token)])
-@limiter.limit("30/minute")
+@router.post("/reviews", response_model=dict, dependencies=[Depends(require_api_token), Depends(limiter.limit("30/minute"))])
 async def submit_review(request: Request, review: ReviewSubmission):
     try:
         created_review = await supabase.create_review(review.dict())
         audit_logger.info("submit_review", user_id=review.user_id, product_id=review.product_id, rating=review.rating)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "success": True,
@@ -70,31 +81,18 @@ async def submit_review(request: Request, review: ReviewSubmission):
             }
         )
     except Exception as e:
-        # Check for unique constraint violation (Postgres error code 23505)
-        if hasattr(e, 'args') and e.args:
-            err = e.args[0]
-            if isinstance(err, dict) and err.get('code') == '23505':
-                audit_logger.warning("duplicate_review", user_id=review.user_id, product_id=review.product_id)
-                return JSONResponse(
-                    status_code=409,
-                    content={
-                        "success": False,
-                        "error": "You have already submitted a review for this product.",
-                        "status_code": 409
-                    }
-                )
-            if isinstance(err, str) and '23505' in err:
-                audit_logger.warning("duplicate_review", user_id=review.user_id, product_id=review.product_id)
-                return JSONResponse(
-                    status_code=409,
-                    content={
-                        "success": False,
-                        "error": "You have already submitted a review for this product.",
-                        "status_code": 409
-                    }
-                )
+        if _is_unique_violation(e):
+            audit_logger.warning("duplicate_review", user_id=review.user_id, product_id=review.product_id)
+            return ORJSONResponse(
+                status_code=409,
+                content={
+                    "success": False,
+                    "error": "You have already submitted a review for this product.",
+                    "status_code": 409
+                }
+            )
         audit_logger.error("submit_review_error", user_id=review.user_id, product_id=review.product_id, error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -103,6 +101,41 @@ async def submit_review(request: Request, review: ReviewSubmission):
             }
         )
 
+@router.post("/reviews/bulk", response_model=dict, dependencies=[Depends(require_api_token), Depends(limiter.limit("5/minute"))])
+async def submit_reviews_bulk(request: Request, reviews: List[ReviewSubmission] = Body(..., max_length=MAX_BULK_REVIEWS)):
+    try:
+        created_reviews = await supabase.create_reviews_bulk([review.dict() for review in reviews])
+        audit_logger.info("submit_reviews_bulk", count=len(created_reviews))
+        return ORJSONResponse(
+            status_code=201,
+            content={
+                "success": True,
+                "review_ids": [review["id"] for review in created_reviews],
+                "message": f"{len(created_reviews)} reviews submitted successfully",
+                "status_code": 201
+            }
+        )
+    except Exception as e:
+        if _is_unique_violation(e):
+            audit_logger.warning("duplicate_review_bulk", count=len(reviews))
+            return ORJSONResponse(
+                status_code=409,
+                content={
+                    "success": False,
+                    "error": "One or more users have already submitted a review for this product.",
+                    "status_code": 409
+                }
+            )
+        audit_logger.error("submit_reviews_bulk_error", count=len(reviews), error=str(e))
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "error": f"Failed to submit reviews: {str(e)}",
+                "status_code": 500
+            }
+        )
+
 @router.get("/products/{product_external_id}/reviews", response_model=ReviewListResponse, dependencies=[Depends(require_api_token)])
 async def get_product_reviews(
     product_external_id: str,
@@ -127,9 +160,15 @@ async def get_product_reviews(
             sort_by=sort_by,
             sort_order=sort_order
         )
+        if get_settings().trust_db:
+            # Rows come straight from Postgres, which already enforces the schema,
+            # so encode them with msgspec instead of validating through pydantic.
+            # convert() decodes the ids and timestamps, so they serialize like the pydantic path
+            body = msgspec.convert(result, ReviewListResponseStruct)
+            return Response(content=msgspec.json.encode(body), media_type="application/json")
         return ReviewListResponse(**result)
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -150,9 +189,13 @@ async def get_product_summary(product_external_id: str):
                 rating_distribution={"1": 0, "2": 0, "3": 0, "4": 0, "5": 0},
                 last_updated=datetime.utcnow()
             )
+        if get_settings().trust_db:
+            # Returning a Response bypasses response_model, so the summary built from
+            # the database row is encoded once without any pydantic validation
+            return ORJSONResponse(content=summary)
         return ReviewSummary(**summary)
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -167,18 +210,18 @@ async def delete_review(review_id: str):
         deleted = await supabase.delete_review(review_id)
         if not deleted:
             audit_logger.info("delete_review_not_found", review_id=review_id)
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"success": False, "error": "Review not found", "status_code": 404}
             )
         audit_logger.info("delete_review", review_id=review_id)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"success": True, "message": "Review deleted", "status_code": 200}
         )
     except Exception as e:
         audit_logger.error("delete_review_error", review_id=review_id, error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "error": f"Failed to delete review: {str(e)}", "status_code": 500}
         ) 
\ No newline at end of file
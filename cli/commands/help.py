@@ -14,7 +14,7 @@ from rich.markdown import Markdown
 
 from cli.utils.display import (
     print_header, print_section, print_panel, 
-    print_command_help, Colors, console
+    print_command_help, console
 )
 from cli.utils.error_handler import error_handler, ValidationError, validate_choice
 from cli.utils.constants import (
@@ -370,7 +370,7 @@ def display_support_information(compact: bool = False):
     issues_table.add_column("Issue", style="cyan")
     issues_table.add_column("Solution", style="white")
     
-    for issue, solution in COMMON_ISSUES:
+    for issue, solution in COMMON_ISSUES.items():
         issues_table.add_row(issue, solution)
     
     console.print(issues_table)
@@ -10,8 +10,7 @@ from dataclasses import dataclass
 
 # Import constants
 from cli.utils.constants import (
-    CLI_VERSION, CLI_APP_NAME, WELCOME_MESSAGE, ASCII_ART, 
-    ASCII_GRADIENT_START, ASCII_GRADIENT_END
+    CLI_VERSION, CLI_APP_NAME, WELCOME_MESSAGE
 )
 
 from cli.utils.config import get_config, CLIConfig
@@ -121,19 +120,9 @@ def display_welcome_message():
     from rich.panel import Panel
     console = Console()
     click.echo()
-    ascii_art = ASCII_ART
-    # Gradient from F22F46 (red) to FFFFFF (white)
-    start_rgb = ASCII_GRADIENT_START
-    end_rgb = ASCII_GRADIENT_END
-    steps = len(ascii_art)
-    def lerp(a, b, t):
-        return int(a + (b - a) * t)
-    for i, line in enumerate(ascii_art):
-        t = i / max(steps - 1, 1)
-        r = lerp(start_rgb[0], end_rgb[0], t)
-        g = lerp(start_rgb[1], end_rgb[1], t)
-        b = lerp(start_rgb[2], end_rgb[2], t)
-        color = f"#{r:02X}{g:02X}{b:02X}"
+    # Gradient from F22F46 (red) to FFFFFF (white), computed on first use
+    from cli.utils.constants import ASCII_ART_RENDERED
+    for line, color in ASCII_ART_RENDERED:
         console.print(line, style=f"bold {color}")
     click.echo()
     click.echo(f"{CLI_APP_NAME} CLI v{CLI_VERSION}")
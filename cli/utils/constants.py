@@ -3,6 +3,8 @@ Constants and configuration for the Rencom CLI
 Centralized location for version numbers, URLs, and other key content
 """
 
+from types import MappingProxyType
+
 # Version Information
 CLI_VERSION = "1.0.3"
 BACKEND_VERSION = "1.0.3"
@@ -48,6 +50,26 @@ ASCII_ART = [
 ASCII_GRADIENT_START = (242, 47, 70)  # F22F46 (red)
 ASCII_GRADIENT_END = (255, 255, 255)  # FFFFFF (white)
 
+
+def _build_gradient(lines, start_rgb, end_rgb):
+    """Pair each line of ASCII art with its hex color along the gradient"""
+    steps = len(lines)
+    rendered = []
+    for i, line in enumerate(lines):
+        t = i / max(steps - 1, 1)
+        r, g, b = (int(a + (z - a) * t) for a, z in zip(start_rgb, end_rgb))
+        rendered.append((line, f"#{r:02X}{g:02X}{b:02X}"))
+    return tuple(rendered)
+
+
+def __getattr__(name):
+    # ASCII_ART_RENDERED is only needed by the welcome screen, so build it on first access
+    if name == "ASCII_ART_RENDERED":
+        value = _build_gradient(ASCII_ART, ASCII_GRADIENT_START, ASCII_GRADIENT_END)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Command Descriptions
 COMMAND_DESCRIPTIONS = {
     "rencom": "Displays welcome message and basic information",
@@ -94,11 +116,11 @@ TROUBLESHOOTING_TIPS = [
     "Environment issues: Check your configuration with 'rencom config'"
 ]
 
-# Common Issues and Solutions
-COMMON_ISSUES = [
-    ("Command not found", "Ensure CLI is installed: pip install rencom-cli"),
-    ("Server connection failed", "Check server URL and ensure server is running"),
-    ("API token invalid", "Run 'rencom setup' to create a new token"),
-    ("Permission denied", "Check file permissions for config files"),
-    ("Import errors", "Verify all dependencies are installed")
-] 
\ No newline at end of file
+# Common Issues and Solutions (issue -> solution, in display order)
+COMMON_ISSUES = MappingProxyType({
+    "Command not found": "Ensure CLI is installed: pip install rencom-cli",
+    "Server connection failed": "Check server URL and ensure server is running",
+    "API token invalid": "Run 'rencom setup' to create a new token",
+    "Permission denied": "Check file permissions for config files",
+    "Import errors": "Verify all dependencies are installed"
+})
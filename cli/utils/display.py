@@ -2,86 +2,147 @@
 Display utilities for formatted CLI output
 """
 
-import click
+import os
+import sys
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
+from rich.markup import render as render_markup
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
+from functools import lru_cache
 import json
 
+if TYPE_CHECKING:
+    from datetime import datetime
 
-# Initialize rich console
-console = Console()
 
+class _PlainConsole:
+    """Minimal console used when color output is disabled or stdout is not a terminal
+    
+    Strings and Text are written straight to stdout with markup removed; other rich
+    renderables (tables, panels) are delegated to an uncolored rich Console.
+    """
+    is_terminal = False
+    
+    def __init__(self):
+        self._rich: Optional[Console] = None
+    
+    def _fallback(self) -> Console:
+        if self._rich is None:
+            self._rich = Console(no_color=True, highlight=False)
+        return self._rich
+    
+    def print(self, *objects: Any, style: Optional[str] = None, end: str = "\n", **kwargs) -> None:
+        parts = []
+        for obj in objects:
+            if isinstance(obj, Text):
+                parts.append(obj.plain)
+            elif isinstance(obj, str):
+                parts.append(render_markup(obj).plain if "[" in obj else obj)
+            else:
+                self._fallback().print(*objects, end=end, **kwargs)
+                return
+        sys.stdout.write(" ".join(parts) + end)
+    
+    def capture(self):
+        return self._fallback().capture()
 
-class Colors:
-    """Color constants for consistent styling"""
-    SUCCESS = "green"
-    ERROR = "red"
-    WARNING = "yellow"
-    INFO = "blue"
-    MUTED = "dim"
-    ACCENT = "cyan"
 
+def _color_disabled() -> bool:
+    """Check whether styled output should be skipped entirely"""
+    return (
+        bool(os.environ.get("NO_COLOR"))
+        or os.environ.get("TERM") == "dumb"
+        or not sys.stdout.isatty()
+    )
 
-def print_success(message: str, title: Optional[str] = None) -> None:
-    """Print success message with green styling"""
+
+# Initialize console (plain-text fallback when color is disabled)
+console = _PlainConsole() if _color_disabled() else Console()
+
+
+# Color constants for consistent styling
+SUCCESS = "green"
+ERROR = "red"
+WARNING = "yellow"
+INFO = "blue"
+MUTED = "dim"
+ACCENT = "cyan"
+
+# Prebuilt bold variants so callers don't format style strings per call
+BOLD_SUCCESS = "bold green"
+BOLD_ERROR = "bold red"
+BOLD_WARNING = "bold yellow"
+BOLD_INFO = "bold blue"
+
+
+# Preallocated underline for print_header, sliced to the header width
+_BAR = "=" * 200
+
+# Maximum rows rendered per table page in print_table
+_TABLE_PAGE_SIZE = 200
+
+# Prebuilt (icon, color, title style) templates for each message class
+_SUCCESS_STYLE = ("✅", SUCCESS, BOLD_SUCCESS)
+_ERROR_STYLE = ("❌", ERROR, BOLD_ERROR)
+_WARNING_STYLE = ("⚠️ ", WARNING, BOLD_WARNING)
+_INFO_STYLE = ("ℹ️ ", INFO, BOLD_INFO)
+
+# Status keywords mapped to their message class
+_STATUS_STYLES = {
+    **dict.fromkeys(('healthy', 'success', 'ok', 'active', 'online'), _SUCCESS_STYLE),
+    **dict.fromkeys(('unhealthy', 'error', 'failed', 'inactive', 'offline'), _ERROR_STYLE),
+    **dict.fromkeys(('warning', 'degraded', 'partial'), _WARNING_STYLE),
+}
+
+
+def _emit(style: tuple, message: str, title: Optional[str] = None) -> None:
+    """Write a status message (with optional title line) in a single print"""
+    icon, color, bold = style
+    if not console.is_terminal:
+        # Plain output for pipes and log files, skipping rich's render pipeline
+        if title:
+            sys.stdout.write(f"{icon} {title} {message}\n")
+        else:
+            sys.stdout.write(f"{icon} {message}\n")
+        return
+    
     if title:
-        console.print(f"✅ {title}", style=f"bold {Colors.SUCCESS}")
-        console.print(f"   {message}", style=Colors.SUCCESS)
+        text = Text(f"{icon} {title}", style=bold)
+        text.append(f"\n   {message}", style=color)
     else:
-        console.print(f"✅ {message}", style=Colors.SUCCESS)
+        text = Text(f"{icon} {message}", style=color)
+    console.print(text)
+
+
+def print_success(message: str, title: Optional[str] = None) -> None:
+    """Print success message with green styling"""
+    _emit(_SUCCESS_STYLE, message, title)
 
 
 def print_error(message: str, title: Optional[str] = None) -> None:
     """Print error message with red styling"""
-    if title:
-        console.print(f"❌ {title}", style=f"bold {Colors.ERROR}")
-        console.print(f"   {message}", style=Colors.ERROR)
-    else:
-        console.print(f"❌ {message}", style=Colors.ERROR)
+    _emit(_ERROR_STYLE, message, title)
 
 
 def print_warning(message: str, title: Optional[str] = None) -> None:
     """Print warning message with yellow styling"""
-    if title:
-        console.print(f"⚠️  {title}", style=f"bold {Colors.WARNING}")
-        console.print(f"   {message}", style=Colors.WARNING)
-    else:
-        console.print(f"⚠️  {message}", style=Colors.WARNING)
+    _emit(_WARNING_STYLE, message, title)
 
 
 def print_info(message: str, title: Optional[str] = None) -> None:
     """Print info message with blue styling"""
-    if title:
-        console.print(f"ℹ️  {title}", style=f"bold {Colors.INFO}")
-        console.print(f"   {message}", style=Colors.INFO)
-    else:
-        console.print(f"ℹ️  {message}", style=Colors.INFO)
+    _emit(_INFO_STYLE, message, title)
 
 
 def print_status(status: str, message: str, details: Optional[str] = None) -> None:
     """Print status message with appropriate color coding"""
-    status_lower = status.lower()
-    
-    if status_lower in ['healthy', 'success', 'ok', 'active', 'online']:
-        color = Colors.SUCCESS
-        icon = "✅"
-    elif status_lower in ['unhealthy', 'error', 'failed', 'inactive', 'offline']:
-        color = Colors.ERROR
-        icon = "❌"
-    elif status_lower in ['warning', 'degraded', 'partial']:
-        color = Colors.WARNING
-        icon = "⚠️"
-    else:
-        color = Colors.INFO
-        icon = "ℹ️"
+    icon, color, bold = _STATUS_STYLES.get(status.lower(), _INFO_STYLE)
     
-    console.print(f"{icon} {status}: {message}", style=f"bold {color}")
+    console.print(f"{icon} {status}: {message}", style=bold)
     if details:
         console.print(f"   {details}", style=color)
 
@@ -94,18 +155,26 @@ def print_table(data: List[Dict[str, Any]], title: Optional[str] = None) -> None
     
     # Get column headers from first row
     headers = list(data[0].keys())
+    columns = [header.replace('_', ' ').title() for header in headers]
     
-    table = Table(title=title, show_header=True, header_style="bold cyan")
-    
-    # Add columns
-    for header in headers:
-        table.add_column(header.replace('_', ' ').title())
-    
-    # Add rows
-    for row in data:
-        table.add_row(*[str(row.get(header, '')) for header in headers])
+    # Render large datasets in pages so the Table and its rendered output never both hold every row
+    for start in range(0, len(data), _TABLE_PAGE_SIZE):
+        table = Table(title=title if start == 0 else None, show_header=True, header_style="bold cyan")
+        
+        # Add columns
+        for column in columns:
+            table.add_column(column)
+        
+        # Add rows
+        for row in data[start:start + _TABLE_PAGE_SIZE]:
+            table.add_row(*[str(row.get(header, '')) for header in headers])
+        
+        # Render into a buffer and flush it with a single write
+        with console.capture() as capture:
+            console.print(table)
+        sys.stdout.write(capture.get())
     
-    console.print(table)
+    sys.stdout.flush()
 
 
 def print_json(data: Dict[str, Any], title: Optional[str] = None) -> None:
@@ -129,7 +198,8 @@ def print_panel(content: str, title: Optional[str] = None, style: str = "cyan")
 def print_header(text: str, style: str = "bold cyan") -> None:
     """Print a header with styling"""
     console.print(f"\n{text}", style=style)
-    console.print("=" * len(text), style=style)
+    width = len(text)
+    console.print(_BAR[:width] if width <= len(_BAR) else "=" * width, style=style)
 
 
 def print_section(title: str, content: str, style: str = "cyan") -> None:
@@ -138,9 +208,13 @@ def print_section(title: str, content: str, style: str = "cyan") -> None:
     console.print(content, style=style)
 
 
-def format_timestamp(timestamp: datetime) -> str:
+def format_timestamp(timestamp: "datetime") -> str:
     """Format timestamp for display"""
-    return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    # Equivalent to strftime("%Y-%m-%d %H:%M:%S") without the format-string parse
+    return (
+        f"{timestamp.year:04d}-{timestamp.month:02d}-{timestamp.day:02d} "
+        f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}"
+    )
 
 
 def format_duration(seconds: float) -> str:
@@ -159,8 +233,42 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.0f}h {remaining_minutes:.0f}m"
 
 
+class _NullProgress:
+    """No-op stand-in for Progress when output is not a terminal"""
+    
+    def __enter__(self) -> "_NullProgress":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+    
+    def start(self) -> None:
+        pass
+    
+    def stop(self) -> None:
+        pass
+    
+    def add_task(self, description: str, *args, **kwargs) -> int:
+        return 0
+    
+    def update(self, task_id: int, *args, **kwargs) -> None:
+        pass
+    
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        pass
+    
+    def remove_task(self, task_id: int) -> None:
+        pass
+
+
+_NULL_PROGRESS = _NullProgress()
+
+
 def create_progress_bar(description: str = "Processing...") -> Progress:
-    """Create a progress bar with spinner"""
+    """Create a progress bar with spinner (a no-op when output is piped)"""
+    if not console.is_terminal:
+        return _NULL_PROGRESS
+    
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -169,14 +277,22 @@ def create_progress_bar(description: str = "Processing...") -> Progress:
     )
 
 
+@lru_cache(maxsize=128)
+def _format_key(key: str) -> str:
+    """Format a dict key as a dotted, padded label"""
+    return f"{key.replace('_', ' ').title():.<20}"
+
+
 def print_key_value_pairs(data: Dict[str, Any], title: Optional[str] = None) -> None:
     """Print key-value pairs in a formatted way"""
     if title:
         print_header(title)
     
-    for key, value in data.items():
-        key_formatted = key.replace('_', ' ').title()
-        console.print(f"{key_formatted:.<20} {value}", style="cyan")
+    if not data:
+        return
+    
+    lines = [f"{_format_key(key)} {value}" for key, value in data.items()]
+    console.print("\n".join(lines), style="cyan")
 
 
 def print_health_status(
@@ -191,17 +307,17 @@ def print_health_status(
     
     # Response time
     response_time_str = format_duration(response_time)
-    console.print(f"   Response time: {response_time_str}", style=Colors.MUTED)
+    console.print(f"   Response time: {response_time_str}", style=MUTED)
     
     # Services status if provided
     if services:
         console.print("\n   Services:", style="bold cyan")
         for service, service_status in services.items():
-            service_color = Colors.SUCCESS if service_status.lower() == 'healthy' else Colors.ERROR
+            service_color = SUCCESS if service_status.lower() == 'healthy' else ERROR
             console.print(f"   • {service}: {service_status}", style=service_color)
 
 
-def print_token_info(token: str, name: str, created_at: datetime, masked: bool = True) -> None:
+def print_token_info(token: str, name: str, created_at: "datetime", masked: bool = True) -> None:
     """Print token information with optional masking"""
     if masked and len(token) > 8:
         displayed_token = f"{token[:4]}...{token[-4:]}"
@@ -209,9 +325,9 @@ def print_token_info(token: str, name: str, created_at: datetime, masked: bool =
         displayed_token = token
     
     print_success("Token generated successfully")
-    console.print(f"   Name: {name}", style=Colors.INFO)
-    console.print(f"   Token: {displayed_token}", style=Colors.ACCENT)
-    console.print(f"   Created: {format_timestamp(created_at)}", style=Colors.MUTED)
+    console.print(f"   Name: {name}", style=INFO)
+    console.print(f"   Token: {displayed_token}", style=ACCENT)
+    console.print(f"   Created: {format_timestamp(created_at)}", style=MUTED)
     
     if masked:
         print_warning("Store this token securely - it won't be shown again!")
@@ -219,6 +335,15 @@ def print_token_info(token: str, name: str, created_at: datetime, masked: bool =
 
 def confirm_action(message: str, default: bool = False) -> bool:
     """Ask for user confirmation with colored prompt"""
+    if not sys.stdin.isatty():
+        # Non-interactive: answer from RENCOM_CONFIRM or fall back to the default
+        answer = os.environ.get("RENCOM_CONFIRM")
+        if answer is None:
+            return default
+        return answer.strip().lower() in ('1', 'y', 'yes', 'true', 'on')
+    
+    import click
+    
     suffix = " [Y/n]" if default else " [y/N]"
     prompt_text = f"{message}{suffix}"
     
@@ -231,6 +356,19 @@ def confirm_action(message: str, default: bool = False) -> bool:
 
 def prompt_for_input(message: str, hide_input: bool = False, required: bool = True) -> str:
     """Prompt for user input with styling"""
+    if not sys.stdin.isatty():
+        # Non-interactive: read a single line from stdin without click's prompt machinery
+        try:
+            value = input().strip()
+        except EOFError:
+            value = ""
+        if required and not value:
+            import click
+            raise click.UsageError(f"{message} is required but no input was provided")
+        return value
+    
+    import click
+    
     prompt_text = click.style(f"{message}: ", fg='cyan')
     
     while True:
@@ -242,25 +380,37 @@ def prompt_for_input(message: str, hide_input: bool = False, required: bool = Tr
         print_error("This field is required. Please enter a value.")
 
 
-def print_command_help(commands: Dict[str, str], title: str = "Available Commands") -> None:
-    """Print command help in a formatted table"""
-    print_header(title)
-    
-    table = Table(show_header=True, header_style="bold cyan")
+def _configure_help_table(table: Table) -> Table:
+    """Add the standard Command/Description columns to a help table"""
     table.add_column("Command", style="cyan")
     table.add_column("Description", style="white")
+    return table
+
+
+@lru_cache(maxsize=8)
+def _render_help(items: tuple) -> str:
+    """Render (command, description) pairs to a string, cached per item set"""
+    table = _configure_help_table(Table(show_header=True, header_style="bold cyan"))
     
-    for command, description in commands.items():
+    for command, description in items:
         table.add_row(command, description)
     
-    console.print(table)
+    with console.capture() as capture:
+        console.print(table)
+    return capture.get()
+
+
+def print_command_help(commands: Dict[str, str], title: str = "Available Commands") -> None:
+    """Print command help in a formatted table"""
+    print_header(title)
+    
+    sys.stdout.write(_render_help(tuple(commands.items())))
+    sys.stdout.flush()
 
 
 def print_setup_section(title: str, content: List[str]) -> None:
     """Print setup documentation section"""
     print_header(title, style="bold green")
     
-    for i, item in enumerate(content, 1):
-        console.print(f"{i}. {item}", style="white")
-    
-    console.print()  # Add spacing
\ No newline at end of file
+    body = "\n".join(f"{i}. {item}" for i, item in enumerate(content, 1))
+    console.print(f"{body}\n", style="white")  # Trailing newline adds spacing
\ No newline at end of file
@@ -2,16 +2,46 @@
 Centralized error handling utilities for CLI commands
 """
 
+import re
 import sys
 import traceback
 import click
 from typing import Optional, Dict, Type, Callable, Any
-from functools import wraps
-from rich.console import Console
+from functools import lru_cache, wraps
+from urllib.parse import urlparse
 
-from cli.utils.display import print_error, print_warning, Colors
+from cli.utils.display import print_error, print_warning
 
-console = Console()
+_console = None
+
+
+def _get_console():
+    """Get the console used for debug output, created on first error"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+# Key for the cached debug flag in click's shared context meta
+_DEBUG_META_KEY = "rencom.debug"
+
+# Accepted spellings for boolean strings
+_TRUE_VALUES = frozenset({'true', 'yes', '1', 'on', 'enable', 'enabled'})
+_FALSE_VALUES = frozenset({'false', 'no', '0', 'off', 'disable', 'disabled'})
+
+# Accepted output formats and log levels (lowercase)
+_OUTPUT_FORMATS = frozenset({'text', 'json', 'yaml', 'table'})
+_OUTPUT_FORMATS_HINT = "text, json, yaml, table"
+_LOG_LEVELS = frozenset({'debug', 'info', 'warning', 'error', 'critical'})
+_LOG_LEVELS_HINT = "debug, info, warning, error, critical"
+
+# Translation table that strips the separators allowed in tokens
+_TOKEN_SEPARATORS = str.maketrans('', '', '-_')
+
+# Precompiled validation patterns
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_TOKEN_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-_\.]+$')
 
 
 class CLIError(Exception):
@@ -74,6 +104,51 @@ ERROR_EXIT_CODES: Dict[Type[Exception], int] = {
 }
 
 
+# Error type to display formatter mapping
+_FORMATTERS: Dict[Type[Exception], Callable[[Exception], str]] = {
+    CLIError: lambda e: e.message,
+    click.ClickException: str,
+    ConnectionError: lambda e: f"Connection failed: {str(e)}",
+    TimeoutError: lambda e: f"Operation timed out: {str(e)}",
+    PermissionError: lambda e: f"Permission denied: {str(e)}",
+    FileNotFoundError: lambda e: f"File not found: {str(e)}",
+    ValueError: lambda e: f"Invalid value: {str(e)}",
+    KeyError: lambda e: f"Missing configuration: {str(e)}",
+}
+
+# Error type to hint mapping
+_HINTS: Dict[Type[Exception], str] = {
+    ConnectionError: "Check if the server is running and accessible",
+    TimeoutError: "Try increasing the timeout with --timeout option",
+    PermissionError: "Check file permissions or run with appropriate privileges",
+    FileNotFoundError: "Ensure the required configuration files exist",
+    KeyError: "Run 'rencom setup --interactive' to configure missing settings",
+    ValueError: "Check the format and validity of your input",
+}
+
+
+def _lookup_by_type(table: Dict[Type[Exception], Any], exc_type: Type[Exception]) -> Any:
+    """Find the entry for the most specific class of exc_type in a type-keyed table"""
+    for cls in exc_type.__mro__:
+        value = table.get(cls)
+        if value is not None:
+            return value
+    return None
+
+
+@lru_cache(maxsize=64)
+def _exit_code_for_type(exc_type: Type[Exception]) -> int:
+    """Exit code for an exception type (the mapping tables are module constants)"""
+    exit_code = _lookup_by_type(ERROR_EXIT_CODES, exc_type)
+    return ExitCodes.GENERAL_ERROR if exit_code is None else exit_code
+
+
+@lru_cache(maxsize=64)
+def _hint_for_type(exc_type: Type[Exception]) -> Optional[str]:
+    """Hint for an exception type (the mapping tables are module constants)"""
+    return _lookup_by_type(_HINTS, exc_type)
+
+
 def get_exit_code(exception: Exception) -> int:
     """Get appropriate exit code for an exception"""
     # Check for specific CLI errors first
@@ -84,55 +159,23 @@ def get_exit_code(exception: Exception) -> int:
     if isinstance(exception, click.ClickException):
         return getattr(exception, 'exit_code', ExitCodes.INVALID_USAGE)
     
-    # Check mapped exception types
-    for exc_type, exit_code in ERROR_EXIT_CODES.items():
-        if isinstance(exception, exc_type):
-            return exit_code
-    
-    # Default to general error
-    return ExitCodes.GENERAL_ERROR
+    # Check mapped exception types, defaulting to general error
+    return _exit_code_for_type(type(exception))
 
 
 def format_error_message(exception: Exception, debug: bool = False) -> str:
     """Format error message for display"""
-    if isinstance(exception, CLIError):
-        return exception.message
-    elif isinstance(exception, click.ClickException):
-        return str(exception)
-    elif isinstance(exception, ConnectionError):
-        return f"Connection failed: {str(exception)}"
-    elif isinstance(exception, TimeoutError):
-        return f"Operation timed out: {str(exception)}"
-    elif isinstance(exception, PermissionError):
-        return f"Permission denied: {str(exception)}"
-    elif isinstance(exception, FileNotFoundError):
-        return f"File not found: {str(exception)}"
-    elif isinstance(exception, ValueError):
-        return f"Invalid value: {str(exception)}"
-    elif isinstance(exception, KeyError):
-        return f"Missing configuration: {str(exception)}"
-    else:
-        return f"Unexpected error: {str(exception)}"
+    formatter = _lookup_by_type(_FORMATTERS, type(exception))
+    if formatter is not None:
+        return formatter(exception)
+    return f"Unexpected error: {str(exception)}"
 
 
 def get_error_hint(exception: Exception) -> Optional[str]:
     """Get helpful hint for an exception"""
     if isinstance(exception, CLIError):
         return exception.hint
-    elif isinstance(exception, ConnectionError):
-        return "Check if the server is running and accessible"
-    elif isinstance(exception, TimeoutError):
-        return "Try increasing the timeout with --timeout option"
-    elif isinstance(exception, PermissionError):
-        return "Check file permissions or run with appropriate privileges"
-    elif isinstance(exception, FileNotFoundError):
-        return "Ensure the required configuration files exist"
-    elif isinstance(exception, KeyError):
-        return "Run 'rencom setup --interactive' to configure missing settings"
-    elif isinstance(exception, ValueError):
-        return "Check the format and validity of your input"
-    else:
-        return None
+    return _hint_for_type(type(exception))
 
 
 def handle_exception(exception: Exception, debug: bool = False, context: Optional[str] = None) -> int:
@@ -169,11 +212,15 @@ def handle_exception(exception: Exception, debug: bool = False, context: Optiona
     
     # Show debug information if requested
     if debug:
+        console = _get_console()
         console.print("\n[bold red]Debug Information:[/bold red]", style="red")
         console.print(f"Exception type: {type(exception).__name__}", style="dim")
-        console.print(f"Exception args: {exception.args}", style="dim")
+        if exception.args:
+            console.print(f"Exception args: {exception.args}", style="dim")
         console.print("\n[bold red]Traceback:[/bold red]", style="red")
-        console.print(traceback.format_exc(), style="dim")
+        # Keep only the 20 innermost frames: where the error was raised, not the wrapper chain
+        tb = "".join(traceback.TracebackException.from_exception(exception, limit=-20).format())
+        console.print(tb, style="dim")
     
     # Get and return exit code
     exit_code = get_exit_code(exception)
@@ -201,6 +248,20 @@ def safe_execute(func: Callable, *args, debug: bool = False, context: Optional[s
         sys.exit(exit_code)
 
 
+def _get_debug_flag() -> bool:
+    """Get the debug flag from the click context, cached once per invocation tree"""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return False
+    
+    # ctx.meta is shared by every context in the invocation, so nested commands reuse it
+    debug = ctx.meta.get(_DEBUG_META_KEY)
+    if debug is None:
+        debug = bool(getattr(ctx.obj, 'debug', False))
+        ctx.meta[_DEBUG_META_KEY] = debug
+    return debug
+
+
 def error_handler(context: Optional[str] = None):
     """
     Decorator for adding error handling to CLI commands
@@ -216,16 +277,12 @@ def error_handler(context: Optional[str] = None):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Get debug flag from click context if available
-            debug = False
-            try:
-                ctx = click.get_current_context(silent=True)
-                if ctx and hasattr(ctx.obj, 'debug'):
-                    debug = ctx.obj.debug
-            except:
-                pass
+            debug = _get_debug_flag()
             
-            return safe_execute(func, *args, debug=debug, context=context, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                sys.exit(handle_exception(e, debug=debug, context=context))
         
         return wrapper
     return decorator
@@ -284,7 +341,7 @@ def validate_token(token: str) -> str:
         )
     
     # Check for valid characters (alphanumeric)
-    if not token.replace('-', '').replace('_', '').isalnum():
+    if not token.translate(_TOKEN_SEPARATORS).isalnum():
         raise ValidationError(
             "Token contains invalid characters",
             hint="Token should only contain letters, numbers, hyphens, and underscores"
@@ -323,15 +380,10 @@ def validate_port(port: int) -> int:
 
 def validate_email(email: str) -> str:
     """Validate email format"""
-    import re
-    
     if not email:
         raise ValidationError("Email cannot be empty")
     
-    # Basic email regex pattern
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(email_pattern, email):
+    if not _EMAIL_RE.match(email):
         raise ValidationError(
             f"Invalid email format: {email}",
             hint="Email must be in format: user@domain.com"
@@ -442,14 +494,24 @@ def validate_positive_integer(value: int, min_value: int = 1, max_value: int = N
 
 def validate_output_format(format_str: str) -> str:
     """Validate output format choice"""
-    valid_formats = ['text', 'json', 'yaml', 'table']
-    return validate_choice(format_str, valid_formats, case_sensitive=False)
+    value = format_str.lower()
+    if value not in _OUTPUT_FORMATS:
+        raise ValidationError(
+            f"Invalid choice: {value}",
+            hint=f"Must be one of: {_OUTPUT_FORMATS_HINT}"
+        )
+    return value
 
 
 def validate_log_level(level: str) -> str:
     """Validate log level choice"""
-    valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-    return validate_choice(level, valid_levels, case_sensitive=False).upper()
+    value = level.lower()
+    if value not in _LOG_LEVELS:
+        raise ValidationError(
+            f"Invalid choice: {value}",
+            hint=f"Must be one of: {_LOG_LEVELS_HINT}"
+        )
+    return value.upper()
 
 
 def validate_boolean_string(value: str) -> bool:
@@ -465,9 +527,9 @@ def validate_boolean_string(value: str) -> bool:
     
     value = value.lower().strip()
     
-    if value in ('true', 'yes', '1', 'on', 'enable', 'enabled'):
+    if value in _TRUE_VALUES:
         return True
-    elif value in ('false', 'no', '0', 'off', 'disable', 'disabled'):
+    elif value in _FALSE_VALUES:
         return False
     else:
         raise ValidationError(
@@ -478,9 +540,6 @@ def validate_boolean_string(value: str) -> bool:
 
 def validate_server_url(url: str) -> str:
     """Enhanced server URL validation"""
-    import re
-    from urllib.parse import urlparse
-    
     if not url:
         raise ValidationError("Server URL cannot be empty")
     
@@ -547,8 +606,7 @@ def validate_token_name(name: str) -> str:
         )
     
     # Check for invalid characters
-    import re
-    if not re.match(r'^[a-zA-Z0-9\s\-_\.]+$', name):
+    if not _TOKEN_NAME_RE.match(name):
         raise ValidationError(
             "Token name contains invalid characters",
             hint="Token name can only contain letters, numbers, spaces, hyphens, underscores, and dots"
@@ -2,21 +2,144 @@
 HTTP client utilities for CLI commands
 """
 
+import atexit
 import httpx
+import importlib.util
 import asyncio
-from typing import Dict, Any, Optional, Union
-from dataclasses import dataclass
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 import click
+from functools import lru_cache
 from urllib.parse import urljoin
+from time import perf_counter
+
+from cli.utils.error_handler import NetworkError
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+
+# Headers sent with every request
+_DEFAULT_HEADERS = {"Content-Type": "application/json"}
+
+# User-facing prefixes for common HTTP error statuses
+_STATUS_PREFIXES = {
+    401: "Authentication failed",
+    403: "Permission denied",
+    404: "Resource not found",
+    429: "Rate limit exceeded",
+}
+
+# Shared clients keyed on (base_url, timeout) so connections are reused across commands
+_CLIENT_CACHE: Dict[Tuple[str, int], httpx.Client] = {}
+
+
+# HTTP/2 needs the optional h2 package; without it clients fall back to HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _client_kwargs(base_url: str, timeout: int) -> Dict[str, Any]:
+    """Constructor arguments shared by the sync and async httpx clients"""
+    return {
+        "base_url": base_url,
+        "timeout": timeout,
+        "http2": _HTTP2_AVAILABLE,
+        "limits": httpx.Limits(max_keepalive_connections=5, max_connections=10),
+    }
+
+
+def _get_shared_client(base_url: str, timeout: int) -> httpx.Client:
+    """Get or lazily create the pooled client for a base URL and timeout"""
+    key = (base_url, timeout)
+    client = _CLIENT_CACHE.get(key)
+    if client is None or client.is_closed:
+        client = httpx.Client(**_client_kwargs(base_url, timeout))
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+def _close_shared_clients() -> None:
+    """Close all pooled clients at interpreter exit"""
+    for client in _CLIENT_CACHE.values():
+        client.close()
+    _CLIENT_CACHE.clear()
+
+
+atexit.register(_close_shared_clients)
+
+
+@lru_cache(maxsize=128)
+def _normalize_endpoint(endpoint: str) -> str:
+    """Turn an endpoint into an absolute URL or a single-slash relative path"""
+    return endpoint if endpoint.startswith('http') else f"/{endpoint.lstrip('/')}"
+
+
+def _prepare(endpoint: str, headers: Optional[Dict[str, str]]) -> Tuple[str, Mapping[str, str]]:
+    """Resolve the request URL and merge headers over the defaults (never mutated)"""
+    url = _normalize_endpoint(endpoint)
+    request_headers = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
+    return url, request_headers
 
 
-@dataclass
 class HTTPResponse:
     """Wrapper for HTTP response data"""
-    status_code: int
-    data: Dict[str, Any]
-    headers: Dict[str, str]
-    response_time: float
+    __slots__ = ('status_code', 'data', '_raw_headers', 'response_time')
+    
+    def __init__(
+        self,
+        status_code: int,
+        data: Dict[str, Any],
+        headers: Mapping[str, str],
+        response_time: float
+    ):
+        self.status_code = status_code
+        self.data = data
+        self._raw_headers = headers
+        self.response_time = response_time
+    
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers as a case-insensitive mapping (not copied)"""
+        return self._raw_headers
+    
+    def __repr__(self) -> str:
+        return f"HTTPResponse(status_code={self.status_code}, response_time={self.response_time:.3f})"
+
+
+def _to_network_error(error: httpx.HTTPError, base_url: str, timeout: int) -> NetworkError:
+    """Translate an httpx error into a CLI NetworkError"""
+    if isinstance(error, httpx.TimeoutException):
+        return NetworkError(
+            f"Request timed out after {timeout} seconds",
+            hint="Try increasing the timeout with --timeout option"
+        )
+    if isinstance(error, httpx.ConnectError):
+        return NetworkError(
+            f"Failed to connect to {base_url}",
+            hint="Check if the server is running and accessible"
+        )
+    if isinstance(error, httpx.NetworkError):
+        return NetworkError(f"Network error: {str(error)}")
+    return NetworkError(f"HTTP request failed: {str(error)}")
+
+
+def _build_response(response: httpx.Response, response_time: float) -> HTTPResponse:
+    """Wrap an httpx response, parsing its body as JSON when possible"""
+    try:
+        data = _json_loads(response.content) if response.content else {}
+    except ValueError:
+        # If response is not JSON, store as text
+        data = {"message": response.text}
+    
+    return HTTPResponse(
+        status_code=response.status_code,
+        data=data,
+        headers=response.headers,
+        response_time=response_time
+    )
 
 
 class HTTPClient:
@@ -29,18 +152,12 @@ class HTTPClient:
     
     def __enter__(self):
         """Context manager entry"""
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-        )
+        self._client = _get_shared_client(self.base_url, self.timeout)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        if self._client:
-            self._client.close()
-            self._client = None
+        """Context manager exit (the pooled client stays open until interpreter exit)"""
+        self._client = None
     
     def _make_request(
         self, 
@@ -54,17 +171,10 @@ class HTTPClient:
         if not self._client:
             raise RuntimeError("HTTP client not initialized. Use within context manager.")
         
-        # Prepare URL
-        url = endpoint if endpoint.startswith('http') else f"/{endpoint.lstrip('/')}"
-        
-        # Prepare headers
-        request_headers = {"Content-Type": "application/json"}
-        if headers:
-            request_headers.update(headers)
+        url, request_headers = _prepare(endpoint, headers)
         
         try:
-            import time
-            start_time = time.time()
+            start_time = perf_counter()
             
             response = self._client.request(
                 method=method,
@@ -74,30 +184,13 @@ class HTTPClient:
                 params=params
             )
             
-            response_time = time.time() - start_time
+            response_time = perf_counter() - start_time
             
-            # Parse response data
-            try:
-                data = response.json() if response.content else {}
-            except ValueError:
-                # If response is not JSON, store as text
-                data = {"message": response.text}
+            return _build_response(response, response_time)
             
-            return HTTPResponse(
-                status_code=response.status_code,
-                data=data,
-                headers=dict(response.headers),
-                response_time=response_time
-            )
-            
-        except httpx.TimeoutException as e:
-            raise TimeoutError(f"Request timed out after {self.timeout} seconds") from e
-        except httpx.ConnectError as e:
-            raise ConnectionError(f"Failed to connect to {self.base_url}") from e
-        except httpx.NetworkError as e:
-            raise ConnectionError(f"Network error: {str(e)}") from e
-        except Exception as e:
-            raise RuntimeError(f"HTTP request failed: {str(e)}") from e
+        except httpx.HTTPError as e:
+            # Drop the httpx cause chain so retry loops don't keep tracebacks alive
+            raise _to_network_error(e, self.base_url, self.timeout) from None
     
     def get(
         self, 
@@ -135,6 +228,77 @@ class HTTPClient:
         return self._make_request("DELETE", endpoint, headers=headers)
 
 
+class AsyncHTTPClient:
+    """Async HTTP client for issuing independent requests concurrently"""
+    
+    def __init__(self, base_url: str, timeout: int = 30):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        self._client = httpx.AsyncClient(**_client_kwargs(self.base_url, self.timeout))
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> HTTPResponse:
+        """Make HTTP request with error handling"""
+        if not self._client:
+            raise RuntimeError("HTTP client not initialized. Use within async context manager.")
+        
+        url, request_headers = _prepare(endpoint, headers)
+        
+        try:
+            start_time = perf_counter()
+            response = await self._client.request(
+                method=method, url=url, headers=request_headers, json=json_data, params=params
+            )
+            return _build_response(response, perf_counter() - start_time)
+        except httpx.HTTPError as e:
+            raise _to_network_error(e, self.base_url, self.timeout) from None
+    
+    async def get_many(
+        self,
+        endpoints: List[str],
+        headers: Optional[Dict[str, str]] = None
+    ) -> List[Union[HTTPResponse, Exception]]:
+        """
+        Make GET requests to several endpoints concurrently
+        
+        Returns:
+            One entry per endpoint, in order: the response, or the exception it raised
+        """
+        tasks = [self._make_request("GET", endpoint, headers=headers) for endpoint in endpoints]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_many(
+    server_url: str,
+    endpoints: List[str],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30
+) -> List[Union[HTTPResponse, Exception]]:
+    """Synchronously fetch several endpoints in parallel"""
+    async def _run():
+        async with AsyncHTTPClient(base_url=server_url, timeout=timeout) as client:
+            return await client.get_many(endpoints, headers=headers)
+    
+    return asyncio.run(_run())
+
+
 def create_client(server_url: str, timeout: int = 30) -> HTTPClient:
     """Factory function to create HTTP client"""
     return HTTPClient(base_url=server_url, timeout=timeout)
@@ -169,18 +333,14 @@ def make_authenticated_request(
 
 def handle_http_error(response: HTTPResponse, operation: str = "request") -> None:
     """Handle HTTP error responses with user-friendly messages"""
-    if response.status_code >= 400:
-        error_msg = response.data.get('detail', response.data.get('message', 'Unknown error'))
-        
-        if response.status_code == 401:
-            raise click.ClickException(f"Authentication failed: {error_msg}")
-        elif response.status_code == 403:
-            raise click.ClickException(f"Permission denied: {error_msg}")
-        elif response.status_code == 404:
-            raise click.ClickException(f"Resource not found: {error_msg}")
-        elif response.status_code == 429:
-            raise click.ClickException(f"Rate limit exceeded: {error_msg}")
-        elif response.status_code >= 500:
-            raise click.ClickException(f"Server error during {operation}: {error_msg}")
-        else:
-            raise click.ClickException(f"HTTP {response.status_code} error during {operation}: {error_msg}")
\ No newline at end of file
+    if response.status_code < 400:
+        return
+    
+    error_msg = response.data.get('detail', response.data.get('message', 'Unknown error'))
+    
+    prefix = _STATUS_PREFIXES.get(response.status_code)
+    if prefix:
+        raise click.ClickException(f"{prefix}: {error_msg}")
+    if response.status_code >= 500:
+        raise click.ClickException(f"Server error during {operation}: {error_msg}")
+    raise click.ClickException(f"HTTP {response.status_code} error during {operation}: {error_msg}")
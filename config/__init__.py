@@ -1,3 +1,3 @@
-from .settings import settings
- 
-__all__ = ["settings"] 
\ No newline at end of file
+from .settings import Settings, get_settings
+
+__all__ = ["Settings", "get_settings"]
@@ -18,10 +18,16 @@ class Settings(BaseSettings):
     supabase_anon_key: str = Field(..., env="SUPABASE_ANON_KEY")
     supabase_service_key: str = Field(..., env="SUPABASE_SERVICE_KEY")
     
+    # Redis (rate limiting)
+    redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
+    
     # Security
     secret_key: str = Field(..., env="SECRET_KEY")
     cors_origins: List[str] = ["*"]
     
+    # Performance
+    trust_db: bool = Field(default=False, env="TRUST_DB")  # skip response validation for DB rows
+    
     # PyPI (optional)
     pypi_token: str = Field(default="", env="PYPI_TOKEN")
 
@@ -48,5 +54,21 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
 
-settings = Settings()
-settings.validate() 
\ No newline at end of file
+_settings = None
+
+
+def get_settings() -> Settings:
+    """Load and validate settings on first use, then reuse the same instance"""
+    global _settings
+    if _settings is None:
+        s = Settings()
+        s.validate()
+        _settings = s
+    return _settings
+
+
+def __getattr__(name):
+    # Keep `from config.settings import settings` working without loading at import time
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,149 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import Request
+from typing import Callable, Deque, Optional, Tuple
+from collections import deque
+from cachetools import TTLCache
+import redis.asyncio as redis
 import structlog
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import time
+import uuid
+
+from config.settings import get_settings
 
 # Rate Limiting
-limiter = Limiter(key_func=get_remote_address, default_limits=["10/minute"])
+# Rolling-window limiter backed by a Redis sorted set per (route, client). The
+# trim, count and add run as one Lua script so the check is atomic across workers.
+_RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return 1
+end
+return 0
+"""
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Redis socket timeouts in seconds, so an unreachable Redis cannot stall requests
+_REDIS_TIMEOUT = 0.5
+# Seconds to stay on the in-process fallback before trying Redis again
+_REDIS_RETRY_INTERVAL = 30
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a client exceeds a route's rate limit"""
+    def __init__(self, limit: str):
+        self.limit = limit
+        super().__init__(f"Rate limit exceeded: {limit}")
+
+
+def _parse_rate(rate: str) -> Tuple[int, int]:
+    """Parse a rate like '5/minute' into (requests, window in milliseconds)"""
+    count, period = rate.split("/", 1)
+    return int(count), _PERIODS[period.strip().rstrip("s")] * 1000
+
+
+def get_remote_address(request: Request) -> str:
+    return request.client.host if request.client else "127.0.0.1"
+
+
+class RedisRateLimiter:
+    def __init__(self, key_func: Callable[[Request], str] = get_remote_address):
+        self.key_func = key_func
+        self._redis: Optional[redis.Redis] = None
+        self._script = None
+        # While Redis is unreachable, limits are enforced per worker instead
+        self._redis_down = False
+        self._retry_at = 0.0
+
+    def _get_script(self):
+        # Connect on first use; register_script calls EVALSHA and reloads on NOSCRIPT
+        if self._script is None:
+            self._redis = redis.from_url(
+                get_settings().redis_url,
+                socket_connect_timeout=_REDIS_TIMEOUT,
+                socket_timeout=_REDIS_TIMEOUT
+            )
+            self._script = self._redis.register_script(_RATE_LIMIT_SCRIPT)
+        return self._script
+
+    async def _allow_redis(self, key: str, now_ms: int, window_ms: int, max_requests: int) -> Optional[bool]:
+        """Check the limit in Redis, or return None if Redis is unavailable"""
+        if self._redis_down and time.monotonic() < self._retry_at:
+            return None
+        try:
+            allowed = await self._get_script()(
+                keys=[key], args=[now_ms, window_ms, max_requests, f"{now_ms}-{uuid.uuid4().hex}"]
+            )
+        except redis.RedisError as e:
+            # Log once per outage, then back off instead of reconnecting on every request
+            if not self._redis_down:
+                logging.warning(f"Rate limiter Redis unavailable, using in-process limits: {e}")
+            self._redis_down = True
+            self._retry_at = time.monotonic() + _REDIS_RETRY_INTERVAL
+            return None
+        if self._redis_down:
+            logging.info("Rate limiter Redis reachable again")
+            self._redis_down = False
+        return bool(allowed)
+
+    def limit(self, rate: str) -> Callable:
+        """Build a FastAPI dependency enforcing `rate` per client on the route"""
+        max_requests, window_ms = _parse_rate(rate)
+        # Fallback windows for this route; an entry expires one window after its last hit
+        local: TTLCache = TTLCache(maxsize=10_000, ttl=window_ms / 1000)
+
+        def allow_local(key: str, now_ms: int) -> bool:
+            hits: Deque[int] = local.get(key) or deque()
+            while hits and hits[0] <= now_ms - window_ms:
+                hits.popleft()
+            allowed = len(hits) < max_requests
+            if allowed:
+                hits.append(now_ms)
+            local[key] = hits
+            return allowed
+
+        async def dependency(request: Request) -> None:
+            key = f"ratelimit:{request.url.path}:{self.key_func(request)}"
+            now_ms = int(time.time() * 1000)
+            allowed = await self._allow_redis(key, now_ms, window_ms, max_requests)
+            if allowed is None:
+                allowed = allow_local(key, now_ms)
+            if not allowed:
+                raise RateLimitExceeded(rate)
+
+        return dependency
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+            self._script = None
+
+
+limiter = RedisRateLimiter(key_func=get_remote_address)
 
 # Audit Logging
+# Request handlers only enqueue records; a background listener thread (started and
+# stopped with the app) does the blocking file and stream writes.
+_log_queue: queue.Queue = queue.Queue(-1)
+log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler("audit.log", delay=True),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format="%(message)s",
-    handlers=[logging.FileHandler("audit.log"), logging.StreamHandler()]
+    handlers=[QueueHandler(_log_queue)]
 )
 structlog.configure(
     processors=[structlog.processors.JSONRenderer()],
     logger_factory=structlog.stdlib.LoggerFactory(),
 )
-audit_logger = structlog.get_logger("audit") 
\ No newline at end of file
+audit_logger = structlog.get_logger("audit") 
@@ -1,35 +1,38 @@
-import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[logging.FileHandler("audit.log"), logging.StreamHandler()]
-)
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 # The following imports are confirmed to exist based on directory scan
-from config.settings import settings
+from config.settings import get_settings
 from api import reviews
-from extensions import limiter, audit_logger
+from extensions import limiter, audit_logger, log_listener, RateLimitExceeded
 import structlog
-import logging
-from slowapi.errors import RateLimitExceeded
 from starlette.requests import Request
+from contextlib import asynccontextmanager
 
 # Standard handler for rate limit exceeded
 
 def _rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={"error": "Rate limit exceeded. Please try again later."}
     )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Audit log writer thread runs for the lifetime of the app
+    log_listener.start()
+    yield
+    await limiter.close()
+    log_listener.stop()
+
 # Create FastAPI app
 app = FastAPI(
-    title=settings.app_name,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    title=get_settings().app_name,
     description="Plug-and-Play Product Reviews API",
-    version=settings.version,
+    version=get_settings().version,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -37,14 +40,13 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=get_settings().cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 # Rate Limiting
-app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 # Audit Logging
@@ -60,6 +62,7 @@ app.include_router(reviews.router, prefix="/api/v1", tags=["reviews"])
 @app.get("/")
 async def root():
     """Health check endpoint"""
+    settings = get_settings()
     return {
         "message": f"{settings.app_name} API is running",
         "version": settings.version,
@@ -79,12 +82,13 @@ async def health_check():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail, "status_code": exc.status_code}
     )
 
 if __name__ == "__main__":
+    settings = get_settings()
     uvicorn.run(
         "main:app",
         host=settings.host,
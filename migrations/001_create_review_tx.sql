@@ -0,0 +1,27 @@
+-- Create a review in a single round-trip.
+-- Registers the product and user on first sight, then inserts the review
+-- and returns the new row. Called from SupabaseService.create_review.
+create or replace function create_review_tx(
+    p_id text,
+    u_id text,
+    rating int,
+    comment text
+)
+returns setof reviews
+language plpgsql
+as $$
+begin
+    insert into products (product_id, name)
+    values (p_id, p_id)
+    on conflict (product_id) do nothing;
+
+    insert into users (id)
+    values (u_id)
+    on conflict (id) do nothing;
+
+    return query
+    insert into reviews (product_id, user_id, rating, comment, status)
+    values (p_id, u_id, create_review_tx.rating, create_review_tx.comment, 'approved')
+    returning *;
+end;
+$$;
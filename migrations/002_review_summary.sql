@@ -0,0 +1,26 @@
+-- Aggregate a product's reviews into one row: average, total, and the
+-- count per star rating. Called from SupabaseService.get_review_summary.
+create or replace function review_summary(p_id text)
+returns table (
+    average_rating numeric,
+    total_reviews int,
+    r1 int,
+    r2 int,
+    r3 int,
+    r4 int,
+    r5 int
+)
+language sql
+stable
+as $$
+    select
+        avg(rating),
+        count(*)::int,
+        (count(*) filter (where rating = 1))::int,
+        (count(*) filter (where rating = 2))::int,
+        (count(*) filter (where rating = 3))::int,
+        (count(*) filter (where rating = 4))::int,
+        (count(*) filter (where rating = 5))::int
+    from reviews
+    where product_id = p_id;
+$$;
@@ -0,0 +1,19 @@
+-- Indexes backing the review list, summary, token and upsert queries.
+-- CONCURRENTLY is omitted because migrations run inside a transaction; on a
+-- large live table, run these statements by hand with CONCURRENTLY instead.
+
+-- get_reviews: filter by product, newest first (default sort)
+create index if not exists reviews_product_created_idx
+    on reviews (product_id, created_at desc);
+
+-- get_reviews rating filter/sort and review_summary aggregation
+create index if not exists reviews_product_rating_idx
+    on reviews (product_id, rating);
+
+-- validate_token lookup
+create unique index if not exists api_tokens_token_idx
+    on api_tokens (token);
+
+-- Product lookups and ON CONFLICT (product_id) upserts
+create unique index if not exists products_product_id_idx
+    on products (product_id);
@@ -0,0 +1,30 @@
+-- Single round-trip find-or-create for products and users.
+-- ON CONFLICT DO NOTHING makes concurrent registrations safe, and existing
+-- rows are returned untouched. Called from SupabaseService.find_or_create_*.
+create or replace function find_or_create_product(p_id text)
+returns setof products
+language plpgsql
+as $$
+begin
+    insert into products (product_id, name)
+    values (p_id, p_id)
+    on conflict (product_id) do nothing;
+
+    return query
+    select * from products where product_id = p_id;
+end;
+$$;
+
+create or replace function find_or_create_user(u_id text, token_id uuid default null)
+returns setof users
+language plpgsql
+as $$
+begin
+    insert into users (id, api_token_id)
+    values (u_id, token_id)
+    on conflict (id) do nothing;
+
+    return query
+    select * from users where id = u_id;
+end;
+$$;
@@ -0,0 +1,26 @@
+-- Create a batch of reviews in a single round-trip and transaction.
+-- Registers every new product and user, then inserts all reviews; a failing
+-- row (e.g. a duplicate review) rolls back the whole batch, registrations
+-- included. Called from SupabaseService.create_reviews_bulk.
+create or replace function create_reviews_bulk_tx(p_reviews jsonb)
+returns setof reviews
+language plpgsql
+as $$
+begin
+    insert into products (product_id, name)
+    select distinct r->>'product_id', r->>'product_id'
+    from jsonb_array_elements(p_reviews) as r
+    on conflict (product_id) do nothing;
+
+    insert into users (id)
+    select distinct r->>'user_id'
+    from jsonb_array_elements(p_reviews) as r
+    on conflict (id) do nothing;
+
+    return query
+    insert into reviews (product_id, user_id, rating, comment, status)
+    select r->>'product_id', r->>'user_id', (r->>'rating')::int, r->>'comment', 'approved'
+    from jsonb_array_elements(p_reviews) as r
+    returning *;
+end;
+$$;
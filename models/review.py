@@ -1,20 +1,28 @@
-from pydantic import BaseModel, Field
+from pydantic.main import BaseModel
+from pydantic.fields import Field
+from pydantic.config import ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 import uuid
 
 class Product(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, populate_by_name=True)
+
     product_id: str = Field(..., description="External product ID")
     name: str = Field(..., description="Product name")
 
 class ReviewSubmission(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, populate_by_name=True)
+
     product_id: str
     user_id: str
     rating: int = Field(..., ge=1, le=5)
     comment: Optional[str] = Field(None, min_length=0, max_length=2000)
 
 class ReviewResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, populate_by_name=True, from_attributes=True)
+
     id: uuid.UUID
     product_id: str
     user_id: str
@@ -23,10 +31,9 @@ class ReviewResponse(BaseModel):
     status: str  # e.g., 'approved', 'pending', 'rejected', 'spam' (for moderation/workflow)
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 class ReviewListResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, populate_by_name=True)
+
     reviews: List[ReviewResponse]
     total: int
     page: int
@@ -36,16 +43,17 @@ class ReviewListResponse(BaseModel):
     has_prev: bool
 
 class ReviewSummary(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, populate_by_name=True, from_attributes=True)
+
     product_id: str
     average_rating: float
     total_reviews: int
     rating_distribution: dict
     last_updated: datetime
 
-    class Config:
-        from_attributes = True
-
 class APIToken(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, populate_by_name=True)
+
     token: str
     name: Optional[str] = None
     created_at: Optional[datetime] = None 
\ No newline at end of file
@@ -0,0 +1,25 @@
+import msgspec
+from typing import Optional, List
+from datetime import datetime
+import uuid
+
+# msgspec mirrors of the review response models in models/review.py, used to
+# encode trusted database rows directly to JSON without a pydantic pass.
+
+class ReviewResponseStruct(msgspec.Struct):
+    id: uuid.UUID
+    product_id: str
+    user_id: str
+    rating: int
+    comment: Optional[str]
+    status: str
+    created_at: datetime
+
+class ReviewListResponseStruct(msgspec.Struct):
+    reviews: List[ReviewResponseStruct]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+    has_next: bool
+    has_prev: bool
@@ -1,71 +1,115 @@
 from supabase import create_client, Client
-from config.settings import settings
-from typing import Dict, Any, Optional
+from postgrest.exceptions import APIError
+from cachetools import TTLCache
+import asyncio
+from config.settings import get_settings
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import lru_cache
 import math
+import re
+import sys
 import uuid
 
+# Recent token validation results. Only touched from the event loop thread, so no
+# lock is needed; concurrent misses for one token just store the same result twice.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Review summaries per product, dropped whenever that product's reviews change.
+# Other workers may serve a stale summary for up to the TTL.
+_summary_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+def _invalidate_summaries(rows: Optional[List[Dict[str, Any]]]) -> None:
+    """Drop cached summaries for the products of changed review rows"""
+    for row in rows or []:
+        _summary_cache.pop(row.get("product_id"), None)
+
+# Rating distribution keys paired with their review_summary columns
+_RATING_FIELDS = tuple((sys.intern(str(i)), sys.intern(f"r{i}")) for i in range(1, 6))
+# get_reviews filter parsing, compiled once at import
+_SORT_WHITELIST = frozenset(("created_at", "rating"))
+_RATING_SPLIT = re.compile(r"\s*,\s*")
+_RATING_RE = re.compile(r"^[1-5]$")
+
+# Columns returned to API clients for each review (matches ReviewResponse)
+REVIEW_COLUMNS = "id, product_id, user_id, rating, comment, status, created_at"
+
+async def _execute(query: Any) -> Any:
+    """Run a blocking supabase query in a worker thread so the event loop stays free"""
+    return await asyncio.to_thread(query.execute)
+
+@lru_cache(maxsize=None)
+def get_client() -> Client:
+    """Process-wide Supabase client, so every service shares one connection pool"""
+    settings = get_settings()
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_service_key
+    )
+
 class SupabaseService:
-    def __init__(self):
-        self.client: Client = create_client(
-            settings.supabase_url,
-            settings.supabase_service_key
-        )
+    @property
+    def client(self) -> Client:
+        return get_client()
 
     async def find_or_create_product(self, product_id: str) -> Dict[str, Any]:
-        result = self.client.table("products").select("*").eq("product_id", product_id).execute().data
-        if result:
-            return result[0]
-        created = self.client.table("products").insert({"product_id": product_id, "name": product_id}).execute().data
-        return created[0]
+        result = await _execute(self.client.rpc("find_or_create_product", {"p_id": product_id}))
+        return result.data[0]
 
     async def find_or_create_user(self, user_id: str, api_token_id: Optional[uuid.UUID] = None) -> Dict[str, Any]:
-        result = self.client.table("users").select("*").eq("id", user_id).execute().data
-        if result:
-            return result[0]
-        data = {"id": user_id}
+        params = {"u_id": user_id}
         if api_token_id:
-            data["api_token_id"] = str(api_token_id)
-        created = self.client.table("users").insert(data).execute().data
-        return created[0]
+            params["token_id"] = str(api_token_id)
+        result = await _execute(self.client.rpc("find_or_create_user", params))
+        return result.data[0]
 
     async def create_review(self, review_data: Dict[str, Any]) -> Dict[str, Any]:
-        # Find or create product
-        product = await self.find_or_create_product(review_data["product_id"])
-        # Find or create user
-        user = await self.find_or_create_user(review_data["user_id"])
-        # Insert review
-        data = {
-            "product_id": product["product_id"],
-            "user_id": user["id"],
+        # Product/user registration and the review insert run server-side in one transaction
+        result = await _execute(self.client.rpc("create_review_tx", {
+            "p_id": review_data["product_id"],
+            "u_id": review_data["user_id"],
             "rating": review_data["rating"],
-            "comment": review_data.get("comment"),
-            "status": "approved"
-        }
-        result = self.client.table("reviews").insert(data).execute()
+            "comment": review_data.get("comment")
+        }))
+        _summary_cache.pop(review_data["product_id"], None)
         return result.data[0] if result.data else None
 
-    async def get_reviews(
+    async def create_reviews_bulk(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not reviews:
+            return []
+        # Product/user registration and every review insert run server-side in one transaction
+        result = await _execute(self.client.rpc("create_reviews_bulk_tx", {
+            "p_reviews": [
+                {
+                    "product_id": r["product_id"],
+                    "user_id": r["user_id"],
+                    "rating": r["rating"],
+                    "comment": r.get("comment")
+                }
+                for r in reviews
+            ]
+        }))
+        for pid in {r["product_id"] for r in reviews}:
+            _summary_cache.pop(pid, None)
+        return result.data or []
+
+    def _filtered_reviews(
         self,
+        columns: str,
         product_id: str,
-        page: int = 1,
-        page_size: int = 50,
-        rating: Optional[str] = None,
-        status: Optional[str] = None,
-        date_from: Optional[str] = None,
-        date_to: Optional[str] = None,
-        sort_by: Optional[str] = "created_at",
-        sort_order: Optional[str] = "desc"
-    ) -> Dict[str, Any]:
-        product = self.client.table("products").select("*").eq("product_id", product_id).execute().data
-        if not product:
-            return {"reviews": [], "total": 0, "page": page, "page_size": page_size, "total_pages": 1, "has_next": False, "has_prev": False}
-        query = self.client.table("reviews").select("*").eq("product_id", product_id)
+        rating: Optional[str],
+        status: Optional[str],
+        date_from: Optional[str],
+        date_to: Optional[str]
+    ) -> Any:
+        """Build a counted reviews query for a product with the get_reviews filters applied"""
+        query = self.client.table("reviews").select(columns, count="exact").eq("product_id", product_id)
         # Filtering
         if rating:
-            ratings = [int(r.strip()) for r in rating.split(",") if r.strip().isdigit()]
-            if ratings:
-                query = query.in_("rating", ratings)
+            # Always filter once a rating was asked for: with no valid 1-5 values left
+            # this sends in.() and matches nothing, rather than dropping the filter
+            ratings = [int(r) for r in _RATING_SPLIT.split(rating.strip()) if _RATING_RE.match(r)]
+            query = query.in_("rating", ratings)
         if status:
             query = query.eq("status", status)
         if date_from:
@@ -80,26 +124,45 @@ class SupabaseService:
                 query = query.lte("created_at", date_to_dt.isoformat())
             except Exception:
                 pass
+        return query
+
+    async def get_reviews(
+        self,
+        product_id: str,
+        page: int = 1,
+        page_size: int = 50,
+        rating: Optional[str] = None,
+        status: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        sort_by: Optional[str] = "created_at",
+        sort_order: Optional[str] = "desc"
+    ) -> Dict[str, Any]:
+        product = await _execute(self.client.table("products").select("product_id").eq("product_id", product_id))
+        if not product.data:
+            return {"reviews": [], "total": 0, "page": page, "page_size": page_size, "total_pages": 1, "has_next": False, "has_prev": False}
+        query = self._filtered_reviews(REVIEW_COLUMNS, product_id, rating, status, date_from, date_to)
         # Sorting
-        if sort_by not in ("created_at", "rating"):
-            sort_by = "created_at"
-        desc = sort_order != "asc"
-        query = query.order(sort_by, desc=desc)
-        all_reviews = query.execute().data or []
-        total = len(all_reviews)
+        query = query.order(sort_by if sort_by in _SORT_WHITELIST else "created_at", desc=sort_order != "asc")
+        # Pagination (only the requested page is transferred; total comes from the count header)
         start = (page - 1) * page_size
-        paginated_reviews = all_reviews[start:start+page_size]
-        reviews_with_info = []
-        for review in paginated_reviews:
-            reviews_with_info.append({
-                **review,
-                "product_id": product_id
-            })
+        try:
+            result = await _execute(query.limit(page_size).offset(start))
+            reviews = result.data or []
+            total = result.count or 0
+        except APIError as e:
+            # PostgREST answers 416 (PGRST103) for an offset past the last row;
+            # serve an empty page and fetch the total separately
+            if e.code != "PGRST103":
+                raise
+            counted = await _execute(self._filtered_reviews("id", product_id, rating, status, date_from, date_to).limit(1))
+            reviews = []
+            total = counted.count or 0
         total_pages = math.ceil(total / page_size) if page_size else 1
         has_next = page < total_pages
         has_prev = page > 1
         return {
-            "reviews": reviews_with_info,
+            "reviews": reviews,
             "total": total,
             "page": page,
             "page_size": page_size,
@@ -109,52 +172,59 @@ class SupabaseService:
         }
 
     async def get_review_summary(self, product_id: str) -> Optional[Dict[str, Any]]:
-        product = self.client.table("products").select("*").eq("product_id", product_id).execute().data
-        if not product:
+        cached = _summary_cache.get(product_id)
+        if cached is not None:
+            return cached
+        # Aggregation runs in Postgres; a single row comes back regardless of review count
+        result = await _execute(self.client.rpc("review_summary", {"p_id": product_id}))
+        row = result.data[0] if result.data else None
+        if not row or not row.get("total_reviews"):
             return None
-        reviews = self.client.table("reviews").select("*").eq("product_id", product_id).execute().data or []
-        total_reviews = len(reviews)
-        if total_reviews == 0:
-            return None
-        rating_sum = 0
-        rating_distribution = {str(i): 0 for i in range(1, 6)}
-        for review in reviews:
-            rating = int(review.get("rating", 0))
-            rating_sum += rating
-            if str(rating) in rating_distribution:
-                rating_distribution[str(rating)] += 1
-        average_rating = round(rating_sum / total_reviews, 2) if total_reviews else 0.0
-        return {
+        total_reviews = row["total_reviews"]
+        rating_distribution = {key: row[column] or 0 for key, column in _RATING_FIELDS}
+        average_rating = round(float(row["average_rating"]), 2)
+        summary = {
             "product_id": product_id,
             "average_rating": average_rating,
             "total_reviews": total_reviews,
             "rating_distribution": rating_distribution,
             "last_updated": datetime.utcnow()
         }
+        _summary_cache[product_id] = summary
+        return summary
 
     async def update_review_status(self, review_id: uuid.UUID, status: str, moderation_note: str = None) -> Dict[str, Any]:
         """Update review status"""
         data = {"status": status}
         if moderation_note:
             data["moderation_note"] = moderation_note
-        result = self.client.table("reviews").update(data).eq("id", str(review_id)).execute()
+        result = await _execute(self.client.table("reviews").update(data).eq("id", str(review_id)))
+        _invalidate_summaries(result.data)
         return result.data[0] if result.data else None
 
     async def create_token(self, token: str, name: Optional[str] = None) -> Dict[str, Any]:
         data = {"token": token, "name": name, "created_at": datetime.utcnow().isoformat()}
-        result = self.client.table("api_tokens").insert(data).execute()
+        result = await _execute(self.client.table("api_tokens").insert(data))
+        _token_cache.pop(token, None)
         return result.data[0] if result.data else None
 
     async def get_token(self, token: str) -> Optional[Dict[str, Any]]:
-        result = self.client.table("api_tokens").select("*").eq("token", token).execute()
+        result = await _execute(self.client.table("api_tokens").select("id").eq("token", token))
         return result.data[0] if result.data else None
 
     async def validate_token(self, token: str) -> bool:
-        result = await self.get_token(token)
-        return result is not None
+        cached = _token_cache.get(token)
+        if cached is not None:
+            return cached
+        # Existence check only: at most one row carrying just its id
+        result = await _execute(self.client.table("api_tokens").select("id").eq("token", token).limit(1))
+        valid = bool(result.data)
+        _token_cache[token] = valid
+        return valid
 
     async def delete_review(self, review_id: str) -> bool:
-        result = self.client.table("reviews").delete().eq("id", review_id).execute()
+        result = await _execute(self.client.table("reviews").delete().eq("id", review_id))
+        _invalidate_summaries(result.data)
         # result.data is a list of deleted rows; if empty, nothing was deleted
         return bool(result.data)
 